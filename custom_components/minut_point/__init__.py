@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
 import voluptuous as vol
 
@@ -13,9 +12,8 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
+from .const import CONF_PROFILING, DOMAIN
 from .coordinator import MinutPointDataUpdateCoordinator
 
 PLATFORMS: list[Platform] = [
@@ -24,7 +22,6 @@ PLATFORMS: list[Platform] = [
 ]
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(minutes=1)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Minut Point component."""
@@ -37,24 +34,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
+        profiling=entry.options.get(CONF_PROFILING, False),
     )
 
     try:
         await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
-        await coordinator.async_close()
+    except Exception:
+        await coordinator.async_unload()
         raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-        await hass.data[DOMAIN][entry.entry_id].async_close()
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_unload()
 
     return unload_ok 
\ No newline at end of file
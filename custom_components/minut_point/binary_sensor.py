@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -15,6 +16,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    ATTR_AGE,
+    ATTR_LAST_UPDATED,
+    ATTR_STALE,
     DOMAIN,
     SENSOR_MOTION,
     SENSOR_ONLINE,
@@ -97,6 +101,7 @@ class MinutPointBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Representation of a Minut Point binary sensor."""
 
     entity_description: MinutPointBinarySensorEntityDescription
+    _unrecorded_attributes = frozenset({ATTR_AGE, ATTR_LAST_UPDATED})
 
     def __init__(
         self,
@@ -128,4 +133,24 @@ class MinutPointBinarySensor(CoordinatorEntity, BinarySensorEntity):
             return None
 
         metrics = device_data["metrics"]
-        return metrics.get(self.entity_description.key, False) 
\ No newline at end of file
+        return metrics.get(self.entity_description.key, False)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last-known value is recent enough to report."""
+        return super().available and self.coordinator.metric_available(
+            self._device_id, self.entity_description.key
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return staleness metadata for the last-known value."""
+        key = self.entity_description.key
+        last_updated = self.coordinator.metric_last_updated(self._device_id, key)
+        age = self.coordinator.metric_age(self._device_id, key)
+        device_data = (self.coordinator.data or {}).get(self._device_id, {})
+        return {
+            ATTR_LAST_UPDATED: last_updated.isoformat() if last_updated else None,
+            ATTR_AGE: int(age.total_seconds()) if age is not None else None,
+            ATTR_STALE: device_data.get("stale", False),
+        }
@@ -1,14 +1,11 @@
 """Constants for the Minut Point integration."""
+from datetime import timedelta
+
 from homeassistant.const import (
-    DEVICE_CLASS_BATTERY,
-    DEVICE_CLASS_HUMIDITY,
-    DEVICE_CLASS_SIGNAL_STRENGTH,
-    DEVICE_CLASS_SOUND_PRESSURE,
-    DEVICE_CLASS_TEMPERATURE,
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-    TEMP_CELSIUS,
-    SOUND_PRESSURE_DB,
+    UnitOfSoundPressure,
+    UnitOfTemperature,
 )
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,15 +15,33 @@ from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 
 DOMAIN = "minut_point"
 MANUFACTURER = "Minut"
+SCAN_INTERVAL = 60
 
 # Configuration
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+CONF_PROFILING = "profiling"
 
 # URLs
 MINUT_BASE_URL = "https://web.minut.com"
 MINUT_LOGIN_URL = f"{MINUT_BASE_URL}/login"
 MINUT_DASHBOARD_URL = f"{MINUT_BASE_URL}/dashboard"
+MINUT_API_URL = "https://api.minut.com/v8"
+
+# Debug logging
+DEBUG_LOG_SAMPLE_RATE = 10
+DEBUG_LOG_MAX_BYTES = 2048
+DEBUG_LOG_TEXT_MAX_BYTES = 200
+DEBUG_REDACT_KEYS = {
+    "access_token",
+    "refresh_token",
+    "id_token",
+    "client_secret",
+    "password",
+    "username",
+    "email",
+    "Authorization",
+}
 
 # Sensor Types
 SENSOR_TEMPERATURE = "temperature"
@@ -39,14 +54,38 @@ SENSOR_ONLINE = "online"
 SENSOR_CHARGING = "charging"
 SENSOR_MOUNTED = "mounted"
 
+# Profiling
+PROFILE_HISTORY = 120
+PROFILE_TOP_ALLOCATIONS = 10
+PROFILE_TRACEMALLOC_FRAMES = 10
+
 # Attributes
 ATTR_DEVICE_ID = "device_id"
 ATTR_DEVICE_NAME = "device_name"
+ATTR_LAST_UPDATED = "last_updated"
+ATTR_AGE = "age_seconds"
+ATTR_STALE = "stale"
+
+# Stale data policy
+API_TIMEOUT = 30
+API_MAX_CONCURRENT_REQUESTS = 4
+STALE_MAX_AGE_DEFAULT = timedelta(minutes=15)
+STALE_MAX_AGE = {
+    SENSOR_TEMPERATURE: timedelta(minutes=30),
+    SENSOR_HUMIDITY: timedelta(minutes=30),
+    SENSOR_SOUND: timedelta(minutes=10),
+    SENSOR_BATTERY: timedelta(hours=6),
+    SENSOR_WIFI: timedelta(minutes=30),
+    SENSOR_MOTION: timedelta(minutes=5),
+    SENSOR_ONLINE: timedelta(minutes=5),
+    SENSOR_CHARGING: timedelta(minutes=30),
+    SENSOR_MOUNTED: timedelta(minutes=30),
+}
 
 # Units
-UNIT_CELSIUS = TEMP_CELSIUS
+UNIT_CELSIUS = UnitOfTemperature.CELSIUS
 UNIT_PERCENT = PERCENTAGE
-UNIT_DB = SOUND_PRESSURE_DB
+UNIT_DB = UnitOfSoundPressure.DECIBEL
 UNIT_WIFI = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
 
 # Device Classes
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 import json
 import re
 import aiohttp
@@ -14,12 +14,20 @@ from urllib.parse import urlencode
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    API_MAX_CONCURRENT_REQUESTS,
+    API_TIMEOUT,
     DOMAIN,
+    MINUT_API_URL,
     MINUT_BASE_URL,
     SCAN_INTERVAL,
+    STALE_MAX_AGE,
+    STALE_MAX_AGE_DEFAULT,
 )
+from .debug_log import MinutPointPayloadLogger
+from .profiler import MinutPointProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,14 +39,25 @@ class MinutPointDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         username: str,
         password: str,
+        profiling: bool = False,
+        api_url: str = MINUT_API_URL,
     ) -> None:
         """Initialize the coordinator."""
         self.username = username
         self.password = password
+        self.api_url = api_url
         self.devices = {}
         self.session = aiohttp.ClientSession()
         self.logged_in = False
         self.access_token = None
+        self._login_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._devices_failed = False
+        self._failed_devices: set[str] = set()
+        self.payload_logger = MinutPointPayloadLogger(_LOGGER)
+        self.profiler = MinutPointProfiler() if profiling else None
+        if self.profiler:
+            self.profiler.start()
 
         super().__init__(
             hass,
@@ -76,66 +95,77 @@ class MinutPointDataUpdateCoordinator(DataUpdateCoordinator):
             }
 
             async with self.session.post(
-                "https://api.minut.com/v8/oauth/token",
+                f"{self.api_url}/oauth/token",
                 headers=headers,
                 data=urlencode(login_data),
             ) as response:
-                if response.status == 401:
+                if response.status in (400, 401):
                     _LOGGER.error("Invalid credentials")
                     raise ConfigEntryAuthFailed("Invalid credentials")
                 elif response.status != 200:
-                    _LOGGER.error("Login failed with status %s", response.status)
-                    raise ConfigEntryAuthFailed(f"Login failed with status {response.status}")
+                    # Server errors are transient; let the stale-data policy
+                    # handle them instead of starting a reauth flow.
+                    _LOGGER.debug("Login failed with status %s", response.status)
+                    raise UpdateFailed(f"Login failed with status {response.status}")
 
                 # Try to parse response as JSON
                 try:
                     data = await response.json()
-                    _LOGGER.debug("Login response: %s", json.dumps(data))
+                    self.payload_logger.payload("Login", data)
                     self.access_token = data.get("access_token")
                     if not self.access_token:
                         raise ConfigEntryAuthFailed("No access token in response")
                 except json.JSONDecodeError:
                     text = await response.text()
-                    _LOGGER.debug("Login response (text): %s", text[:200])
-                    raise ConfigEntryAuthFailed("Invalid response from server")
+                    self.payload_logger.text("Login", text)
+                    raise UpdateFailed("Invalid login response from server")
 
             self.logged_in = True
             _LOGGER.info("Successfully logged in to Minut Point")
 
         except aiohttp.ClientError as err:
-            _LOGGER.error("Error during login: %s", err)
-            raise ConfigEntryAuthFailed(f"Error during login: {err}")
+            _LOGGER.debug("Error during login: %s", err)
+            raise UpdateFailed(f"Error during login: {err}")
+
+    async def _relogin(self, rejected_token: str | None) -> None:
+        """Log in again unless a concurrent request already refreshed the token."""
+        async with self._login_lock:
+            if self.access_token == rejected_token:
+                self.logged_in = False
+                await self._login()
 
     async def _get_device_details(self, device_id: str) -> dict:
         """Get detailed metrics for a device."""
         if not self.logged_in:
             await self._login()
 
+        access_token = self.access_token
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
             "Accept": "application/json",
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {access_token}",
         }
 
         try:
             async with self.session.get(
-                f"https://api.minut.com/v8/devices/{device_id}/metrics",
+                f"{self.api_url}/devices/{device_id}/metrics",
                 headers=headers,
             ) as response:
                 if response.status == 401:
-                    self.logged_in = False
-                    await self._login()
+                    await self._relogin(access_token)
                     return await self._get_device_details(device_id)
                 elif response.status != 200:
                     raise UpdateFailed(f"Error {response.status} while getting device details")
 
                 try:
                     data = await response.json()
-                    _LOGGER.debug("Device details response: %s", json.dumps(data))
+                    self.payload_logger.payload(
+                        "Device metrics", data, detail=device_id
+                    )
                     return data
                 except json.JSONDecodeError:
                     text = await response.text()
-                    _LOGGER.debug("Device details response (text): %s", text[:200])
+                    self.payload_logger.text("Device metrics", text, detail=device_id)
                     raise UpdateFailed("Invalid response from server")
 
         except aiohttp.ClientError as err:
@@ -154,7 +184,7 @@ class MinutPointDataUpdateCoordinator(DataUpdateCoordinator):
 
         try:
             async with self.session.get(
-                "https://api.minut.com/v8/devices",
+                f"{self.api_url}/devices",
                 headers=headers,
             ) as response:
                 if response.status == 401:
@@ -166,35 +196,188 @@ class MinutPointDataUpdateCoordinator(DataUpdateCoordinator):
 
                 try:
                     data = await response.json()
-                    _LOGGER.debug("Devices response: %s", json.dumps(data))
+                    self.payload_logger.payload("Devices", data, on_change=True)
                     return data.get("devices", [])
                 except json.JSONDecodeError:
                     text = await response.text()
-                    _LOGGER.debug("Devices response (text): %s", text[:200])
+                    self.payload_logger.text("Devices", text)
                     raise UpdateFailed("Invalid response from server")
 
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
 
     async def _async_update_data(self):
-        """Update data via library."""
+        """Update data via library, sampling the cycle if profiling is on."""
+        if self.profiler is None:
+            return await self._async_fetch_data()
+
+        data = None
+        try:
+            data = await self._async_fetch_data()
+            return data
+        finally:
+            await self.profiler.async_record(self.hass, self, data)
+
+    async def _async_fetch_data(self) -> dict:
+        """Fetch devices and their metrics.
+
+        The device list and all metrics requests share one API_TIMEOUT budget,
+        with metrics fetched concurrently. Devices whose metrics cannot be
+        fetched in time keep their last-known values and are marked stale. If
+        the device list itself cannot be fetched, the previous data is served
+        as-is; entities become unavailable once their metric exceeds its
+        maximum age.
+        """
+        self.payload_logger.start_refresh()
+        previous = self.data or {}
+        data = None
+        deadline = self.hass.loop.time() + API_TIMEOUT
+
+        try:
+            try:
+                async with async_timeout.timeout(API_TIMEOUT):
+                    devices = await self._get_devices()
+            except (asyncio.TimeoutError, UpdateFailed) as err:
+                if not previous:
+                    raise UpdateFailed(f"Error fetching devices: {err}") from err
+                if self._devices_failed:
+                    _LOGGER.debug("Devices still unavailable: %s", err)
+                else:
+                    _LOGGER.warning(
+                        "Error fetching devices, serving last-known data: %s", err
+                    )
+                self._devices_failed = True
+                return {
+                    device_id: {**device, "stale": True}
+                    for device_id, device in previous.items()
+                }
+
+            if self._devices_failed:
+                _LOGGER.info("Fetching devices recovered")
+            self._devices_failed = False
+
+            results = await self._async_fetch_metrics(
+                [device["device_id"] for device in devices],
+                deadline - self.hass.loop.time(),
+            )
+            data = {
+                device["device_id"]: self._merge_device(
+                    device, previous.get(device["device_id"]), result
+                )
+                for device, result in zip(devices, results)
+            }
+            return data
+        finally:
+            self.payload_logger.end_refresh(
+                len(data if data is not None else previous),
+                success=data is not None,
+            )
+
+    async def _async_fetch_metrics(
+        self, device_ids: list[str], timeout: float
+    ) -> list[dict | BaseException]:
+        """Fetch metrics for all devices concurrently within the timeout.
+
+        Returns the metrics or the exception for each device, in order.
+        Requests still running when the timeout expires are cancelled and
+        reported as timeouts.
+        """
+
+        async def fetch(device_id: str) -> dict:
+            async with self._request_semaphore:
+                return await self._get_device_details(device_id)
+
+        tasks = [asyncio.create_task(fetch(device_id)) for device_id in device_ids]
+        if not tasks:
+            return []
         try:
-            async with async_timeout.timeout(30):
-                devices = await self._get_devices()
-                if not devices:
-                    return {}
+            _, pending = await asyncio.wait(tasks, timeout=max(timeout, 0))
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: list[dict | BaseException] = []
+        for task in tasks:
+            if task in pending:
+                results.append(asyncio.TimeoutError("Timed out fetching metrics"))
+            elif (err := task.exception()) is not None:
+                if not isinstance(err, UpdateFailed):
+                    raise err
+                results.append(err)
+            else:
+                results.append(task.result())
+        return results
 
-                # Get details for each device
-                for device in devices:
-                    device_id = device["device_id"]
-                    device["metrics"] = await self._get_device_details(device_id)
+    def _merge_device(
+        self, device: dict, previous: dict | None, result: dict | BaseException
+    ) -> dict:
+        """Merge fetched metrics into a device, falling back to last-known values."""
+        device_id = device["device_id"]
+        previous = previous or {}
+        metrics = dict(previous.get("metrics", {}))
+        metrics_updated = dict(previous.get("metrics_updated", {}))
 
-                return devices
+        if isinstance(result, BaseException):
+            if device_id in self._failed_devices:
+                _LOGGER.debug(
+                    "Metrics for device %s still unavailable: %s", device_id, result
+                )
+            else:
+                _LOGGER.warning(
+                    "Error fetching metrics for device %s, serving last-known data: %s",
+                    device_id,
+                    result,
+                )
+                self._failed_devices.add(device_id)
+            return {
+                **device,
+                "metrics": metrics,
+                "metrics_updated": metrics_updated,
+                "last_updated": previous.get("last_updated"),
+                "stale": True,
+            }
 
-        except asyncio.TimeoutError as err:
-            raise UpdateFailed(f"Timeout error: {err}")
+        if device_id in self._failed_devices:
+            _LOGGER.info("Fetching metrics for device %s recovered", device_id)
+            self._failed_devices.discard(device_id)
+
+        now = dt_util.utcnow()
+        metrics.update(result)
+        metrics_updated.update(dict.fromkeys(result, now))
+        return {
+            **device,
+            "metrics": metrics,
+            "metrics_updated": metrics_updated,
+            "last_updated": now,
+            "stale": False,
+        }
+
+    def metric_last_updated(self, device_id: str, key: str) -> datetime | None:
+        """Return when a metric was last received from the API."""
+        device = (self.data or {}).get(device_id)
+        if device is None:
+            return None
+        return device.get("metrics_updated", {}).get(key)
+
+    def metric_age(self, device_id: str, key: str) -> timedelta | None:
+        """Return the age of the last-known value of a metric."""
+        if (last_updated := self.metric_last_updated(device_id, key)) is None:
+            return None
+        return dt_util.utcnow() - last_updated
+
+    def metric_available(self, device_id: str, key: str) -> bool:
+        """Return True if a metric is recent enough to be reported."""
+        if (age := self.metric_age(device_id, key)) is None:
+            return False
+        return age <= STALE_MAX_AGE.get(key, STALE_MAX_AGE_DEFAULT)
 
     async def async_unload(self):
         """Clean up resources when unloading the integration."""
-        if self.session:
+        if self.profiler:
+            self.profiler.stop()
+        if self.session and not self.session.closed:
             await self.session.close() 
\ No newline at end of file
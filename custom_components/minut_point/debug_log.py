@@ -0,0 +1,161 @@
+"""Sampled, redacted debug logging for the Minut Point API client."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import (
+    DEBUG_LOG_MAX_BYTES,
+    DEBUG_LOG_SAMPLE_RATE,
+    DEBUG_LOG_TEXT_MAX_BYTES,
+    DEBUG_REDACT_KEYS,
+)
+
+_TEXT_REDACT_RE = re.compile(
+    rf"({'|'.join(map(re.escape, sorted(DEBUG_REDACT_KEYS)))})"
+    r"([\"']?\s*[:=]\s*)(?:\"[^\"]*\"?|'[^']*'?|[^\"'&,;\s}]+)",
+    re.IGNORECASE,
+)
+_BEARER_RE = re.compile(r"(Bearer\s+)[^\"'\s]+", re.IGNORECASE)
+
+
+class MinutPointPayloadLogger:
+    """Log API payloads without leaking credentials or flooding the log.
+
+    Payloads are only redacted and serialized when they are actually logged.
+    Each endpoint is logged on its first response and every
+    ``sample_rate``-th response after that. Callers can also ask for a payload
+    to be logged whenever it changes; this hashes every response, so it is
+    meant for small, slow-changing payloads such as the device list.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_rate: int = DEBUG_LOG_SAMPLE_RATE,
+        max_bytes: int = DEBUG_LOG_MAX_BYTES,
+    ) -> None:
+        """Initialize the payload logger."""
+        self._logger = logger
+        self._sample_rate = max(1, sample_rate)
+        self._max_bytes = max_bytes
+        self._counters: dict[str, int] = {}
+        self._digests: dict[str, str] = {}
+        self._refresh_started: float | None = None
+        self._refresh_stats: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if debug logging is enabled for the client."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def tracked_endpoints(self) -> int:
+        """Return the number of endpoints seen, whether or not debug is on."""
+        return len(self._counters)
+
+    @staticmethod
+    def _truncate(text: str, max_bytes: int) -> str:
+        """Cap text at max_bytes."""
+        encoded = text.encode("utf-8", errors="replace")
+        if len(encoded) <= max_bytes:
+            return text
+        truncated = encoded[:max_bytes].decode("utf-8", errors="ignore")
+        return f"{truncated}... [truncated {len(encoded) - max_bytes} bytes]"
+
+    @staticmethod
+    def _redact_text_match(match: re.Match[str]) -> str:
+        """Replace a key/value match in text, keeping any quotes."""
+        value = match.group(0)[match.end(2) - match.start(0) :]
+        quote = value[0] if value[0] in "\"'" else ""
+        return f"{match.group(1)}{match.group(2)}{quote}**REDACTED**{quote}"
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        """Add to a per-refresh summary counter."""
+        self._refresh_stats[key] = self._refresh_stats.get(key, 0) + amount
+
+    def payload(
+        self,
+        endpoint: str,
+        data: Any,
+        on_change: bool = False,
+        detail: str | None = None,
+    ) -> None:
+        """Log a JSON response for an endpoint if it is sampled.
+
+        Responses are sampled per ``endpoint``; ``detail`` (such as a device
+        ID) is only added to the log message, so requests that differ only
+        in detail share one sampling counter.
+        """
+        self._count("responses")
+        count = self._counters.get(endpoint, 0)
+        self._counters[endpoint] = count + 1
+        if not self.enabled:
+            return
+
+        changed = False
+        if on_change:
+            digest = hashlib.sha1(
+                json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+            changed = self._digests.get(endpoint) != digest
+            self._digests[endpoint] = digest
+
+        if count % self._sample_rate and not changed:
+            return
+
+        if isinstance(data, (dict, list)):
+            data = async_redact_data(data, DEBUG_REDACT_KEYS)
+        text = self._truncate(json.dumps(data, default=str), self._max_bytes)
+        self._count("logged")
+        self._count("bytes", len(text.encode("utf-8", errors="replace")))
+        self._logger.debug(
+            "%s response (#%d%s): %s",
+            f"{endpoint} {detail}" if detail else endpoint,
+            count + 1,
+            ", changed" if changed else "",
+            text,
+        )
+
+    def text(self, endpoint: str, text: str, detail: str | None = None) -> None:
+        """Log a redacted, truncated non-JSON response body."""
+        self._count("responses")
+        if not self.enabled:
+            return
+        text = text[: DEBUG_LOG_TEXT_MAX_BYTES * 2]
+        text = _BEARER_RE.sub(r"\1**REDACTED**", text)
+        text = _TEXT_REDACT_RE.sub(self._redact_text_match, text)
+        text = self._truncate(text, DEBUG_LOG_TEXT_MAX_BYTES)
+        self._count("logged")
+        self._count("bytes", len(text.encode("utf-8", errors="replace")))
+        self._logger.debug(
+            "%s response (text): %s",
+            f"{endpoint} {detail}" if detail else endpoint,
+            text,
+        )
+
+    def start_refresh(self) -> None:
+        """Mark the start of a refresh cycle."""
+        self._refresh_started = time.monotonic()
+        self._refresh_stats = {}
+
+    def end_refresh(self, devices: int, success: bool = True) -> None:
+        """Emit a single summary line for the finished refresh cycle."""
+        if not self.enabled or self._refresh_started is None:
+            return
+        self._logger.debug(
+            "Refresh %s: devices=%d responses=%d logged=%d logged_bytes=%d "
+            "duration=%.3fs",
+            "complete" if success else "failed",
+            devices,
+            self._refresh_stats.get("responses", 0),
+            self._refresh_stats.get("logged", 0),
+            self._refresh_stats.get("bytes", 0),
+            time.monotonic() - self._refresh_started,
+        )
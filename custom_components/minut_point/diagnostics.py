@@ -0,0 +1,32 @@
+"""Diagnostics support for Minut Point."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import MinutPointDataUpdateCoordinator
+from .profiler import open_connections
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MinutPointDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "last_update_success": coordinator.last_update_success,
+        "devices": len(data),
+        "stale_devices": sum(1 for device in data.values() if device.get("stale")),
+        "open_connections": open_connections(coordinator.session),
+        "profiling": coordinator.profiler.as_dict() if coordinator.profiler else None,
+    }
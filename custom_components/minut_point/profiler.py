@@ -0,0 +1,171 @@
+"""Opt-in memory and connection profiling for the Minut Point coordinator."""
+from __future__ import annotations
+
+from collections import deque
+import os
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    PROFILE_HISTORY,
+    PROFILE_TOP_ALLOCATIONS,
+    PROFILE_TRACEMALLOC_FRAMES,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import MinutPointDataUpdateCoordinator
+
+TREND_KEYS = (
+    "traced_bytes",
+    "integration_bytes",
+    "open_connections",
+    "devices",
+    "metrics",
+    "endpoints",
+)
+# Match any frame so objects allocated inside json or aiohttp on behalf of
+# this integration, such as parsed payloads, are counted as ours.
+INTEGRATION_FILTER = tracemalloc.Filter(
+    True, f"{os.path.dirname(__file__)}/*", all_frames=True
+)
+
+
+def open_connections(session: aiohttp.ClientSession) -> int | None:
+    """Return the number of connections held by a session's connector.
+
+    This relies on aiohttp connector internals; None is returned if they are
+    not available rather than silently reporting zero.
+    """
+    connector = session.connector
+    if session.closed or connector is None:
+        return 0
+    acquired = getattr(connector, "_acquired", None)
+    conns = getattr(connector, "_conns", None)
+    if acquired is None or conns is None:
+        return None
+    return len(acquired) + sum(len(idle) for idle in conns.values())
+
+
+def _slope(values: list[float]) -> float:
+    """Return the least-squares slope of values per sample, ignoring None."""
+    values = [value for value in values if value is not None]
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(count))
+    return numerator / denominator
+
+
+class MinutPointProfiler:
+    """Record allocations and coordinator-owned resources per refresh cycle.
+
+    Uses tracemalloc, so it is only enabled through the integration options.
+    Samples are kept in a bounded history to avoid becoming a leak itself.
+    """
+
+    def __init__(
+        self,
+        history: int = PROFILE_HISTORY,
+        top_allocations: int = PROFILE_TOP_ALLOCATIONS,
+    ) -> None:
+        """Initialize the profiler."""
+        self.cycles = 0
+        self.samples: deque[dict[str, Any]] = deque(maxlen=history)
+        self.top_allocations: list[str] = []
+        self._top_count = top_allocations
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        """Start tracing allocations if nothing else is already tracing.
+
+        If tracing was already started elsewhere with fewer frames,
+        allocations made in libraries on our behalf may not be attributed
+        to the integration.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations if this profiler started it."""
+        if self._owns_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracemalloc = False
+        self._snapshot = None
+
+    def _snapshot_integration(self) -> int:
+        """Snapshot allocations made by this integration and diff the last one.
+
+        Runs in the executor, as taking a snapshot walks every traced block.
+        Returns the bytes currently allocated from this integration's files.
+        """
+        if not tracemalloc.is_tracing():
+            return 0
+        snapshot = tracemalloc.take_snapshot().filter_traces([INTEGRATION_FILTER])
+        if self._snapshot is not None:
+            stats = snapshot.compare_to(self._snapshot, "lineno")
+            self.top_allocations = [str(stat) for stat in stats[: self._top_count]]
+        self._snapshot = snapshot
+        return sum(stat.size for stat in snapshot.statistics("filename"))
+
+    async def async_record(
+        self,
+        hass: HomeAssistant,
+        coordinator: MinutPointDataUpdateCoordinator,
+        data: dict | None,
+    ) -> dict[str, Any]:
+        """Take a sample at the end of a refresh cycle.
+
+        ``data`` is the result of the refresh, or None if it failed.
+        """
+        self.cycles += 1
+        traced, peak, integration = (0, 0, 0)
+        if tracemalloc.is_tracing():
+            traced, peak = tracemalloc.get_traced_memory()
+            integration = await hass.async_add_executor_job(
+                self._snapshot_integration
+            )
+
+        success = data is not None
+        data = data if success else coordinator.data or {}
+        sample = {
+            "cycle": self.cycles,
+            "timestamp": dt_util.utcnow().isoformat(),
+            "success": success,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "integration_bytes": integration,
+            "devices": len(data),
+            "metrics": sum(len(device.get("metrics", {})) for device in data.values()),
+            "endpoints": coordinator.payload_logger.tracked_endpoints,
+            "open_connections": open_connections(coordinator.session),
+        }
+        self.samples.append(sample)
+        return sample
+
+    def trends(self) -> dict[str, float]:
+        """Return the growth per cycle of each tracked value over the history."""
+        samples = list(self.samples)
+        return {
+            f"{key}_per_cycle": _slope([sample[key] for sample in samples])
+            for key in TREND_KEYS
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profiling state for diagnostics."""
+        return {
+            "cycles": self.cycles,
+            "tracing": tracemalloc.is_tracing(),
+            "trends": self.trends(),
+            "top_allocations": self.top_allocations,
+            "samples": list(self.samples),
+        }
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Long-run soak benchmark for the Minut Point coordinator.
+
+Runs the coordinator with profiling enabled against a local fake Minut API
+that periodically fails, then checks that traced memory and open sockets do
+not keep growing. Exits non-zero if they do.
+"""
+import argparse
+from array import array
+import asyncio
+import gc
+import logging
+import os
+import statistics
+import sys
+import tempfile
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from custom_components.minut_point.const import (  # noqa: E402
+    API_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.minut_point.coordinator import (  # noqa: E402
+    MinutPointDataUpdateCoordinator,
+)
+from custom_components.minut_point.profiler import open_connections  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+_LOGGER = logging.getLogger(__name__)
+
+
+def create_fake_api(devices: int) -> web.Application:
+    """Create a fake Minut API that fails every few requests."""
+    counters = {"devices": 0, "metrics": 0}
+
+    async def token(request: web.Request) -> web.Response:
+        return web.json_response({"access_token": "soak-token", "expires_in": 3600})
+
+    async def list_devices(request: web.Request) -> web.Response:
+        counters["devices"] += 1
+        if counters["devices"] % 11 == 0:
+            return web.Response(status=503)
+        return web.json_response(
+            {
+                "devices": [
+                    {"device_id": f"device{index}", "name": f"Point {index}"}
+                    for index in range(devices)
+                ]
+            }
+        )
+
+    async def metrics(request: web.Request) -> web.Response:
+        counters["metrics"] += 1
+        if counters["metrics"] % 7 == 0:
+            return web.Response(status=500)
+        tick = counters["metrics"]
+        return web.json_response(
+            {
+                "temperature": 20 + tick % 5,
+                "humidity": 40 + tick % 10,
+                "sound_level": 30 + tick % 20,
+                "motion_detected": tick % 2 == 0,
+                "online": True,
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/v8/oauth/token", token)
+    app.router.add_get("/v8/devices", list_devices)
+    app.router.add_get("/v8/devices/{device_id}/metrics", metrics)
+    return app
+
+
+async def soak(args: argparse.Namespace) -> bool:
+    """Run the soak benchmark and return True if resources stayed bounded."""
+    runner = web.AppRunner(create_fake_api(args.devices))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = MinutPointDataUpdateCoordinator(
+            hass,
+            "soak@example.com",
+            "soak",
+            profiling=True,
+            api_url=f"http://127.0.0.1:{port}/v8",
+        )
+
+        # Preallocated so the benchmark's own bookkeeping is not traced as
+        # growth; -1 marks a connection count that could not be read.
+        traced = array("q", [0]) * args.cycles
+        connections = array("q", [0]) * args.cycles
+        try:
+            for cycle in range(1, args.cycles + 1):
+                await coordinator.async_refresh()
+                gc.collect()
+                sample = coordinator.profiler.samples[-1]
+                traced[cycle - 1] = sample["traced_bytes"]
+                connections[cycle - 1] = (
+                    -1
+                    if sample["open_connections"] is None
+                    else sample["open_connections"]
+                )
+                if cycle % 100 == 0:
+                    _LOGGER.info(
+                        "Cycle %d: traced=%d bytes connections=%d",
+                        cycle,
+                        sample["traced_bytes"],
+                        sample["open_connections"],
+                    )
+
+            trends = coordinator.profiler.trends()
+        finally:
+            await coordinator.async_unload()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+    _LOGGER.info(
+        "Trends over the last %d cycles: %s",
+        len(coordinator.profiler.samples),
+        trends,
+    )
+    for line in coordinator.profiler.top_allocations:
+        _LOGGER.info("Top allocation change: %s", line)
+
+    # The profiler only keeps the most recent samples, so also check the
+    # growth over the whole run, skipping the warm-up cycles.
+    steady = traced[args.warmup :]
+    run_growth = (
+        statistics.linear_regression(range(len(steady)), steady).slope
+        if len(steady) > 1
+        else 0.0
+    )
+    _LOGGER.info(
+        "Traced memory over cycles %d-%d: first=%d last=%d, %.1f bytes per cycle",
+        min(args.warmup, len(traced)) + 1,
+        len(traced),
+        steady[0] if steady else 0,
+        steady[-1] if steady else 0,
+        run_growth,
+    )
+
+    ok = True
+    if run_growth > args.max_bytes_per_cycle:
+        _LOGGER.error(
+            "Traced memory grows by %.1f bytes per cycle over the run (limit %d)",
+            run_growth,
+            args.max_bytes_per_cycle,
+        )
+        ok = False
+    if -1 in connections:
+        _LOGGER.error(
+            "Cannot count open connections; aiohttp connector internals changed"
+        )
+        return False
+    max_connections = max(connections)
+    if trends["traced_bytes_per_cycle"] > args.max_bytes_per_cycle:
+        _LOGGER.error(
+            "Traced memory grows by %.1f bytes per cycle (limit %d)",
+            trends["traced_bytes_per_cycle"],
+            args.max_bytes_per_cycle,
+        )
+        ok = False
+    if max_connections > args.max_connections or trends["open_connections_per_cycle"] > 0.01:
+        _LOGGER.error(
+            "Open connections not bounded: max %d (limit %d), %.3f per cycle",
+            max_connections,
+            args.max_connections,
+            trends["open_connections_per_cycle"],
+        )
+        ok = False
+    if not coordinator.session.closed or open_connections(coordinator.session):
+        _LOGGER.error("Session still open after unload")
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--max-bytes-per-cycle", type=int, default=256)
+    parser.add_argument(
+        "--max-connections", type=int, default=API_MAX_CONCURRENT_REQUESTS
+    )
+
+    if not asyncio.run(soak(parser.parse_args())):
+        sys.exit(1)